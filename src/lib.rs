@@ -8,6 +8,7 @@ use arrow::array::{
     TimestampSecondArray, UInt16Array, UInt32Array, UInt64Array, UInt8Array,
 };
 use arrow::datatypes::{DataType, TimeUnit as ArrowTimeUnit};
+use arrow::record_batch::RecordBatch;
 use base64::{engine::general_purpose::STANDARD, Engine as _};
 use chrono::NaiveDate;
 use serde_json::{json, Map, Number, Value};
@@ -263,7 +264,126 @@ fn arrow_value_to_serde_json(array: &dyn Array, row_idx: usize) -> Value {
             ),
         ),
 
-        _ => Value::String(format!("<unsupported_type: {:?}>", array.data_type())),
+        DataType::Dictionary(_, value_type) => {
+            arrow::compute::cast(&array.slice(row_idx, 1), value_type)
+                .map(|values| arrow_value_to_serde_json(values.as_ref(), 0))
+                .unwrap_or_else(|_| unsupported_type_value(array.data_type()))
+        }
+
+        _ => unsupported_type_value(array.data_type()),
+    }
+}
+
+/// Placeholder emitted for values of types without a JSON conversion
+fn unsupported_type_value(data_type: &DataType) -> Value {
+    Value::String(format!("<unsupported_type: {:?}>", data_type))
+}
+
+/// Convert the first `num_rows` values of an Arrow array into JSON values
+///
+/// Scalar, fixed-size list, struct and dictionary columns are converted once
+/// for the whole array rather than once per value; other types fall back to
+/// `arrow_value_to_serde_json` row by row.
+fn arrow_array_to_serde_json(array: &dyn Array, num_rows: usize) -> Vec<Value> {
+    fn convert<A: Array + 'static>(
+        array: &dyn Array,
+        num_rows: usize,
+        to_json: impl Fn(&A, usize) -> Value,
+    ) -> Vec<Value> {
+        let typed_array = array.as_any().downcast_ref::<A>().unwrap();
+        (0..num_rows)
+            .map(|row_idx| {
+                if typed_array.is_null(row_idx) {
+                    Value::Null
+                } else {
+                    to_json(typed_array, row_idx)
+                }
+            })
+            .collect()
+    }
+
+    match array.data_type() {
+        DataType::Boolean => convert(array, num_rows, |a: &BooleanArray, i| {
+            Value::Bool(a.value(i))
+        }),
+        DataType::Int8 => convert(array, num_rows, |a: &Int8Array, i| json!(a.value(i))),
+        DataType::Int16 => convert(array, num_rows, |a: &Int16Array, i| json!(a.value(i))),
+        DataType::Int32 => convert(array, num_rows, |a: &Int32Array, i| json!(a.value(i))),
+        DataType::Int64 => convert(array, num_rows, |a: &Int64Array, i| json!(a.value(i))),
+        DataType::UInt8 => convert(array, num_rows, |a: &UInt8Array, i| json!(a.value(i))),
+        DataType::UInt16 => convert(array, num_rows, |a: &UInt16Array, i| json!(a.value(i))),
+        DataType::UInt32 => convert(array, num_rows, |a: &UInt32Array, i| json!(a.value(i))),
+        DataType::UInt64 => convert(array, num_rows, |a: &UInt64Array, i| json!(a.value(i))),
+        DataType::Float32 => convert(array, num_rows, |a: &Float32Array, i| {
+            Number::from_f64(a.value(i) as f64)
+                .map(Value::Number)
+                .unwrap_or(Value::Null)
+        }),
+        DataType::Float64 => convert(array, num_rows, |a: &Float64Array, i| {
+            Number::from_f64(a.value(i))
+                .map(Value::Number)
+                .unwrap_or(Value::Null)
+        }),
+        DataType::Utf8 => convert(array, num_rows, |a: &StringArray, i| {
+            Value::String(a.value(i).to_string())
+        }),
+        DataType::LargeUtf8 => convert(array, num_rows, |a: &LargeStringArray, i| {
+            Value::String(a.value(i).to_string())
+        }),
+        DataType::FixedSizeList(_, size) => {
+            // Convert the flattened child values in one pass, then split per row
+            let list_array = array.as_any().downcast_ref::<FixedSizeListArray>().unwrap();
+            let size = *size as usize;
+            let mut values =
+                arrow_array_to_serde_json(list_array.values().as_ref(), num_rows * size)
+                    .into_iter();
+            (0..num_rows)
+                .map(|row_idx| {
+                    let row_values: Vec<Value> = values.by_ref().take(size).collect();
+                    if list_array.is_null(row_idx) {
+                        Value::Null
+                    } else {
+                        Value::Array(row_values)
+                    }
+                })
+                .collect()
+        }
+        DataType::Struct(fields) => {
+            // Convert each child column in one pass, then assemble objects per row
+            let struct_array = array.as_any().downcast_ref::<StructArray>().unwrap();
+            let mut child_values: Vec<_> = struct_array
+                .columns()
+                .iter()
+                .map(|child_array| {
+                    arrow_array_to_serde_json(child_array.as_ref(), num_rows).into_iter()
+                })
+                .collect();
+            (0..num_rows)
+                .map(|row_idx| {
+                    let mut json_map = Map::new();
+                    for (field, values) in fields.iter().zip(child_values.iter_mut()) {
+                        json_map.insert(field.name().clone(), values.next().unwrap_or(Value::Null));
+                    }
+                    if struct_array.is_null(row_idx) {
+                        Value::Null
+                    } else {
+                        Value::Object(json_map)
+                    }
+                })
+                .collect()
+        }
+        DataType::Dictionary(_, value_type) => {
+            // Unpack the dictionary once, then convert the plain values
+            match arrow::compute::cast(&array.slice(0, num_rows), value_type) {
+                Ok(values) => arrow_array_to_serde_json(values.as_ref(), num_rows),
+                Err(_) => (0..num_rows)
+                    .map(|row_idx| arrow_value_to_serde_json(array, row_idx))
+                    .collect(),
+            }
+        }
+        _ => (0..num_rows)
+            .map(|row_idx| arrow_value_to_serde_json(array, row_idx))
+            .collect(),
     }
 }
 
@@ -290,13 +410,10 @@ pub fn lance_table_info(
     let schema = scanner.schema();
     let columns = arrow_schema_to_pg_columns(schema.as_ref());
 
-    let rows: Vec<_> = columns
-        .into_iter()
-        .map(|(name, pg_type, nullable)| {
-            let type_name = types::pg_type_name(pg_type).to_string();
-            (name, type_name, nullable)
-        })
-        .collect();
+    let rows = columns.into_iter().map(|(name, pg_type, nullable)| {
+        let type_name = types::pg_type_name(pg_type).to_string();
+        (name, type_name, nullable)
+    });
 
     TableIterator::new(rows)
 }
@@ -330,75 +447,170 @@ pub fn lance_table_stats(
 }
 
 /// Scan Lance table and return data in JSONB format
+///
+/// When `columns` is given only those columns are read from Lance and
+/// included in each row object. An empty `columns` array is rejected.
 #[pg_extern]
 pub fn lance_scan_jsonb(
     table_path: &str,
     limit: default!(Option<i64>, "NULL"),
+    columns: default!(Option<Vec<String>>, "NULL"),
 ) -> TableIterator<'static, (name!(row_data, pgrx::JsonB),)> {
+    if columns.as_ref().is_some_and(|columns| columns.is_empty()) {
+        ereport!(
+            ERROR,
+            PgSqlErrorCode::ERRCODE_INVALID_PARAMETER_VALUE,
+            "columns must name at least one column"
+        );
+    }
+
     let scanner = LanceScanner::new(table_path)
         .unwrap_or_else(|_| pgrx::error!("Failed to open Lance table at: {}", table_path));
 
     let scan_iter = scanner
-        .scan_with_filter(None, limit)
-        .unwrap_or_else(|_| pgrx::error!("Failed to create scan iterator"));
-
-    let schema = scanner.schema();
+        .scan_with_filter(None, columns.as_deref(), limit)
+        .unwrap_or_else(|error_code| match error_code {
+            PgSqlErrorCode::ERRCODE_UNDEFINED_COLUMN => {
+                let requested = columns.as_deref().unwrap_or_default();
+                let schema = scanner.schema();
+                let missing: Vec<&str> = requested
+                    .iter()
+                    .filter(|name| schema.field_with_name(name).is_err())
+                    .map(String::as_str)
+                    .collect();
+                // Fall back to the full request if Lance rejected a nested path
+                let names = if missing.is_empty() {
+                    requested.join(", ")
+                } else {
+                    missing.join(", ")
+                };
+                ereport!(
+                    ERROR,
+                    PgSqlErrorCode::ERRCODE_UNDEFINED_COLUMN,
+                    format!("Column(s) not found in Lance table: {}", names)
+                );
+            }
+            _ => pgrx::error!("Failed to create scan iterator"),
+        });
 
-    let mut results = Vec::new();
-    let mut rows_outputted_count = 0i64;
+    let rows_remaining = limit.map_or(usize::MAX, |l_pg| l_pg.max(0) as usize);
 
-    'batch_loop: for record_batch in scan_iter.batches {
-        for row_idx_in_batch in 0..record_batch.num_rows() {
-            if let Some(l_pg) = limit {
-                if rows_outputted_count >= l_pg {
-                    break 'batch_loop;
-                }
+    // Batches are read lazily as PostgreSQL pulls rows from the iterator
+    let rows = scan_iter
+        .map(|batch_result| {
+            batch_result.unwrap_or_else(|_| pgrx::error!("Failed to read Lance record batch"))
+        })
+        .scan(rows_remaining, |rows_remaining, record_batch| {
+            if *rows_remaining == 0 {
+                return None;
             }
 
+            // Lance already applies the limit; this clamp is only a fallback in
+            // case a scan returns more rows than requested
+            let num_rows = record_batch.num_rows().min(*rows_remaining);
+            *rows_remaining -= num_rows;
+            Some(record_batch_to_jsonb_rows(&record_batch, num_rows))
+        })
+        .flatten();
+
+    TableIterator::new(rows)
+}
+
+/// Convert the first `num_rows` rows of a record batch into JSONB objects
+fn record_batch_to_jsonb_rows(record_batch: &RecordBatch, num_rows: usize) -> Vec<(pgrx::JsonB,)> {
+    // Take names from the batch itself so projected scans stay aligned
+    let schema = record_batch.schema();
+
+    // Convert column by column, then stitch the values back into rows
+    let mut column_values: Vec<_> = record_batch
+        .columns()
+        .iter()
+        .map(|column_array| arrow_array_to_serde_json(column_array.as_ref(), num_rows).into_iter())
+        .collect();
+
+    (0..num_rows)
+        .map(|_| {
             let mut json_map = Map::new();
-            for (col_idx, field) in schema.fields().iter().enumerate() {
-                let column_array = record_batch.column(col_idx);
-                let value = arrow_value_to_serde_json(column_array.as_ref(), row_idx_in_batch);
-                json_map.insert(field.name().clone(), value);
+            for (field, values) in schema.fields().iter().zip(column_values.iter_mut()) {
+                json_map.insert(field.name().clone(), values.next().unwrap_or(Value::Null));
             }
-            results.push((pgrx::JsonB(Value::Object(json_map)),));
-            rows_outputted_count += 1;
-        }
-    }
-
-    TableIterator::new(results)
+            (pgrx::JsonB(Value::Object(json_map)),)
+        })
+        .collect()
 }
 
 #[cfg(any(test, feature = "pg_test"))]
 #[pg_schema]
 mod tests {
-    use arrow::array::{BooleanArray, Float32Array, Int32Array, StringArray};
-    use arrow::datatypes::{DataType, Field, Schema};
+    use arrow::array::{
+        ArrayRef, BooleanArray, Date32Array, DictionaryArray, FixedSizeListArray, Float32Array,
+        Float64Array, Int32Array, Int64Array, StringArray, StructArray, TimestampMicrosecondArray,
+    };
+    use arrow::buffer::{BooleanBuffer, NullBuffer};
+    use arrow::datatypes::{DataType, Field, Fields, Int32Type, Schema, TimeUnit};
+    use arrow::error::ArrowError;
     use arrow::record_batch::RecordBatch;
+    use lance::dataset::WriteParams;
     use lance::Dataset;
+    use lance_file::version::LanceFileVersion;
     use pgrx::prelude::*;
+    use std::collections::BTreeSet;
     use std::sync::Arc;
     use tempfile::TempDir;
 
     /// Test data generator for Lance tables using synchronous blocking operations
     struct LanceTestDataGenerator {
         temp_dir: TempDir,
+        runtime: &'static tokio::runtime::Runtime,
     }
 
     impl LanceTestDataGenerator {
         fn new() -> Result<Self, Box<dyn std::error::Error>> {
             let temp_dir = TempDir::new()?;
-            Ok(Self { temp_dir })
+            // Reuse the extension's runtime instead of building one per write
+            let runtime = crate::scanner::runtime()
+                .map_err(|e| format!("Failed to start async runtime: {:?}", e))?;
+            Ok(Self { temp_dir, runtime })
         }
 
         fn get_base_path(&self) -> &std::path::Path {
             self.temp_dir.path()
         }
 
-        /// Create a simple table with basic data types
-        fn create_simple_table(&self) -> Result<std::path::PathBuf, Box<dyn std::error::Error>> {
-            let table_path = self.get_base_path().join("simple_table");
+        /// Write record batches as a new Lance table under the base path
+        ///
+        /// Batches are pulled from the iterator as Lance writes them, so lazily
+        /// generated tables never need to be fully materialized. `params`
+        /// overrides Lance's default write parameters, e.g. to split fragments.
+        fn write_table<I>(
+            &self,
+            name: &str,
+            schema: Arc<Schema>,
+            batches: I,
+            params: Option<WriteParams>,
+        ) -> Result<String, Box<dyn std::error::Error>>
+        where
+            I: IntoIterator<Item = Result<RecordBatch, ArrowError>>,
+            I::IntoIter: Send + 'static,
+        {
+            let table_path = self
+                .get_base_path()
+                .join(name)
+                .to_str()
+                .ok_or("Temporary directory path is not valid UTF-8")?
+                .to_string();
 
+            // Use RecordBatchIterator for lance
+            let reader = arrow::record_batch::RecordBatchIterator::new(batches, schema);
+
+            self.runtime
+                .block_on(async { Dataset::write(reader, &table_path, params).await })?;
+
+            Ok(table_path)
+        }
+
+        /// Create a simple table with basic data types
+        fn create_simple_table(&self) -> Result<String, Box<dyn std::error::Error>> {
             // Create sample data with various basic types
             let id_array = Int32Array::from(vec![1, 2, 3, 4, 5]);
             let name_array = StringArray::from(vec!["Alice", "Bob", "Charlie", "David", "Eve"]);
@@ -406,6 +618,15 @@ mod tests {
             let salary_array =
                 Float32Array::from(vec![50000.5, 65000.0, 80000.25, 95000.75, 120000.0]);
             let is_active_array = BooleanArray::from(vec![true, true, false, true, false]);
+            // Temporal columns are built from raw epoch offsets (days / microseconds)
+            let hire_date_array = Date32Array::from(vec![18276, 18067, 17600, 17475, 17038]);
+            let created_at_array = TimestampMicrosecondArray::from(vec![
+                1_704_105_000_000_000,
+                1_704_195_930_000_000,
+                1_704_273_300_000_000,
+                1_704_378_015_000_000,
+                1_704_470_400_000_000,
+            ]);
 
             let schema = Arc::new(Schema::new(vec![
                 Field::new("id", DataType::Int32, false),
@@ -413,6 +634,12 @@ mod tests {
                 Field::new("age", DataType::Int32, false),
                 Field::new("salary", DataType::Float32, false),
                 Field::new("is_active", DataType::Boolean, false),
+                Field::new("hire_date", DataType::Date32, false),
+                Field::new(
+                    "created_at",
+                    DataType::Timestamp(TimeUnit::Microsecond, None),
+                    false,
+                ),
             ]));
 
             let batch = RecordBatch::try_new(
@@ -423,53 +650,56 @@ mod tests {
                     Arc::new(age_array),
                     Arc::new(salary_array),
                     Arc::new(is_active_array),
+                    Arc::new(hire_date_array),
+                    Arc::new(created_at_array),
                 ],
             )?;
 
-            // Use RecordBatchIterator for lance
-            let reader = arrow::record_batch::RecordBatchIterator::new(vec![Ok(batch)], schema);
-
-            // Use a new runtime for async operation
-            let rt = tokio::runtime::Runtime::new().unwrap();
-            rt.block_on(async {
-                Dataset::write(reader, table_path.to_str().unwrap(), None).await
-            })?;
-
-            Ok(table_path)
+            self.write_table("simple_table", schema, vec![Ok(batch)], None)
         }
 
         /// Create a table with vector embeddings
-        fn create_vector_table(&self) -> Result<std::path::PathBuf, Box<dyn std::error::Error>> {
-            let table_path = self.get_base_path().join("vector_table");
-
+        fn create_vector_table(&self) -> Result<String, Box<dyn std::error::Error>> {
             let id_array = Int32Array::from(vec![1, 2, 3]);
             let document_array = StringArray::from(vec!["doc1", "doc2", "doc3"]);
 
-            // Create vector embeddings as List array
-            let mut list_builder =
-                arrow::array::ListBuilder::new(arrow::array::Float32Builder::new());
-
-            // Add each embedding vector
-            for embedding in [
-                vec![0.1, 0.2, 0.3, 0.4],
-                vec![0.5, 0.6, 0.7, 0.8],
-                vec![0.9, 1.0, 1.1, 1.2],
-            ] {
-                for value in embedding {
-                    list_builder.values().append_value(value);
-                }
-                list_builder.append(true);
-            }
-            let list_array = list_builder.finish();
+            // Create vector embeddings as a FixedSizeList<Float32, 4> array
+            let embedding_values = Float32Array::from(vec![
+                0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
+            ]);
+            let embedding_array = FixedSizeListArray::try_new(
+                Arc::new(Field::new("item", DataType::Float32, true)),
+                4,
+                Arc::new(embedding_values),
+                None,
+            )?;
+
+            // Store metadata as a native struct column rather than JSON text
+            let metadata_fields = Fields::from(vec![
+                Field::new("category", DataType::Utf8, false),
+                Field::new("score", DataType::Float64, false),
+            ]);
+            let metadata_array = StructArray::new(
+                metadata_fields.clone(),
+                vec![
+                    Arc::new(StringArray::from(vec!["A", "B", "A"])),
+                    Arc::new(Float64Array::from(vec![0.95, 0.87, 0.92])),
+                ],
+                None,
+            );
 
             let schema = Arc::new(Schema::new(vec![
                 Field::new("id", DataType::Int32, false),
                 Field::new("document", DataType::Utf8, false),
                 Field::new(
                     "embedding",
-                    DataType::List(Arc::new(Field::new("item", DataType::Float32, true))),
+                    DataType::FixedSizeList(
+                        Arc::new(Field::new("item", DataType::Float32, true)),
+                        4,
+                    ),
                     false,
                 ),
+                Field::new("metadata", DataType::Struct(metadata_fields), false),
             ]));
 
             let batch = RecordBatch::try_new(
@@ -477,21 +707,168 @@ mod tests {
                 vec![
                     Arc::new(id_array),
                     Arc::new(document_array),
-                    Arc::new(list_array),
+                    Arc::new(embedding_array),
+                    Arc::new(metadata_array),
                 ],
             )?;
 
-            let reader = arrow::record_batch::RecordBatchIterator::new(vec![Ok(batch)], schema);
+            self.write_table("vector_table", schema, vec![Ok(batch)], None)
+        }
 
-            let rt = tokio::runtime::Runtime::new().unwrap();
-            rt.block_on(async {
-                Dataset::write(reader, table_path.to_str().unwrap(), None).await
-            })?;
+        /// Create a larger table for scans spanning many rows
+        ///
+        /// Rows are generated in batches of `batch_rows` while Lance writes, and
+        /// columns are built straight from iterators into Arrow buffers, so memory
+        /// stays bounded by one batch regardless of `size`. Each fragment holds at
+        /// most `batch_rows` rows, so scans read one record batch per fragment.
+        fn create_large_table(
+            &self,
+            size: usize,
+            batch_rows: usize,
+        ) -> Result<String, Box<dyn std::error::Error>> {
+            // Only ten distinct categories, so store them dictionary-encoded
+            const CATEGORIES: [&str; 10] = [
+                "cat_0", "cat_1", "cat_2", "cat_3", "cat_4", "cat_5", "cat_6", "cat_7", "cat_8",
+                "cat_9",
+            ];
 
-            Ok(table_path)
+            let schema = Arc::new(Schema::new(vec![
+                Field::new("id", DataType::Int64, false),
+                Field::new("value", DataType::Float64, false),
+                Field::new(
+                    "category",
+                    DataType::Dictionary(Box::new(DataType::Int32), Box::new(DataType::Utf8)),
+                    false,
+                ),
+                Field::new("flag", DataType::Boolean, false),
+            ]));
+
+            let categories: ArrayRef = Arc::new(StringArray::from(CATEGORIES.to_vec()));
+
+            let batch_schema = schema.clone();
+            let batches = (0..size).step_by(batch_rows).map(move |start| {
+                let end = (start + batch_rows).min(size);
+
+                let id_array = Int64Array::from_iter_values(start as i64 + 1..=end as i64);
+                let value_array =
+                    Float64Array::from_iter_values((start..end).map(|i| i as f64 * 0.1));
+                let category_array = DictionaryArray::<Int32Type>::try_new(
+                    Int32Array::from_iter_values((start..end).map(|i| (i % 10) as i32)),
+                    categories.clone(),
+                )?;
+                let flag_array = BooleanArray::new(
+                    BooleanBuffer::collect_bool(end - start, |i| (start + i) % 2 == 0),
+                    None,
+                );
+
+                RecordBatch::try_new(
+                    batch_schema.clone(),
+                    vec![
+                        Arc::new(id_array),
+                        Arc::new(value_array),
+                        Arc::new(category_array),
+                        Arc::new(flag_array),
+                    ],
+                )
+            });
+
+            let params = WriteParams {
+                max_rows_per_file: batch_rows,
+                max_rows_per_group: batch_rows,
+                ..Default::default()
+            };
+
+            self.write_table("large_table", schema, batches, Some(params))
+        }
+
+        /// Create a table whose nullable columns hold null slots
+        ///
+        /// Null slots keep child values underneath, so the columnar JSON converter
+        /// must skip them without shifting the rows that follow.
+        fn create_nullable_table(&self) -> Result<String, Box<dyn std::error::Error>> {
+            let id_array = Int32Array::from(vec![1, 2, 3, 4]);
+            let name_array = StringArray::from(vec![Some("a"), None, Some("c"), Some("d")]);
+
+            // Row 3 is a null embedding whose child values are still present
+            let embedding_array = FixedSizeListArray::try_new(
+                Arc::new(Field::new("item", DataType::Float32, true)),
+                2,
+                Arc::new(Float32Array::from(vec![
+                    1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0,
+                ])),
+                Some(NullBuffer::from(vec![true, true, false, true])),
+            )?;
+
+            // Row 2 is a null struct, row 3 a struct with a null child
+            let metadata_fields = Fields::from(vec![
+                Field::new("category", DataType::Utf8, true),
+                Field::new("score", DataType::Float64, false),
+            ]);
+            let metadata_array = StructArray::try_new(
+                metadata_fields.clone(),
+                vec![
+                    Arc::new(StringArray::from(vec![
+                        Some("A"),
+                        Some("B"),
+                        None,
+                        Some("D"),
+                    ])),
+                    Arc::new(Float64Array::from(vec![0.5, 0.6, 0.7, 0.9])),
+                ],
+                Some(NullBuffer::from(vec![true, false, true, true])),
+            )?;
+
+            let schema = Arc::new(Schema::new(vec![
+                Field::new("id", DataType::Int32, false),
+                Field::new("name", DataType::Utf8, true),
+                Field::new(
+                    "embedding",
+                    DataType::FixedSizeList(
+                        Arc::new(Field::new("item", DataType::Float32, true)),
+                        2,
+                    ),
+                    true,
+                ),
+                Field::new("metadata", DataType::Struct(metadata_fields), true),
+            ]));
+
+            let batch = RecordBatch::try_new(
+                schema.clone(),
+                vec![
+                    Arc::new(id_array),
+                    Arc::new(name_array),
+                    Arc::new(embedding_array),
+                    Arc::new(metadata_array),
+                ],
+            )?;
+
+            // Null structs are only stored from Lance file format 2.1 on
+            let params = WriteParams {
+                data_storage_version: Some(LanceFileVersion::V2_1),
+                ..Default::default()
+            };
+
+            self.write_table("nullable_table", schema, vec![Ok(batch)], Some(params))
         }
     }
 
+    /// Collect the column names reported by `lance_table_info`
+    fn info_column_names(table_info: &[(String, String, bool)]) -> BTreeSet<&str> {
+        table_info
+            .iter()
+            .map(|(name, _, _)| name.as_str())
+            .collect()
+    }
+
+    /// Collect the keys of a JSON object returned by `lance_scan_jsonb`
+    fn row_keys(row: &serde_json::Value) -> BTreeSet<&str> {
+        row.as_object()
+            .expect("Scanned row should be a JSON object")
+            .keys()
+            .map(String::as_str)
+            .collect()
+    }
+
     #[pg_test]
     fn test_hello_pglance() {
         assert_eq!("Hello, pglance", crate::hello_pglance());
@@ -514,13 +891,22 @@ mod tests {
         let table_path = generator
             .create_simple_table()
             .expect("Failed to create simple table");
-        let table_path_str = table_path.to_str().unwrap();
+        let table_path_str = table_path.as_str();
 
         // Test table info
         let table_info: Vec<(String, String, bool)> =
             crate::lance_table_info(table_path_str).collect::<Vec<_>>();
 
-        assert_eq!(table_info.len(), 5);
+        let expected_columns = BTreeSet::from([
+            "id",
+            "name",
+            "age",
+            "salary",
+            "is_active",
+            "hire_date",
+            "created_at",
+        ]);
+        assert_eq!(info_column_names(&table_info), expected_columns);
 
         // Check specific columns
         let id_column = table_info.iter().find(|(name, _, _)| name == "id").unwrap();
@@ -539,6 +925,18 @@ mod tests {
             .unwrap();
         assert_eq!(salary_column.1, "float4");
 
+        let hire_date_column = table_info
+            .iter()
+            .find(|(name, _, _)| name == "hire_date")
+            .unwrap();
+        assert_eq!(hire_date_column.1, "date");
+
+        let created_at_column = table_info
+            .iter()
+            .find(|(name, _, _)| name == "created_at")
+            .unwrap();
+        assert_eq!(created_at_column.1, "timestamp");
+
         // Test table stats
         let stats: Vec<(i64, i64, i32)> =
             crate::lance_table_stats(table_path_str).collect::<Vec<_>>();
@@ -547,17 +945,18 @@ mod tests {
         let (version, num_rows, num_columns) = stats[0];
         assert!(version >= 1);
         assert_eq!(num_rows, 5);
-        assert_eq!(num_columns, 5);
+        assert_eq!(num_columns, 7);
 
         // Test data scanning
         let data: Vec<(pgrx::JsonB,)> =
-            crate::lance_scan_jsonb(table_path_str, Some(3)).collect::<Vec<_>>();
+            crate::lance_scan_jsonb(table_path_str, Some(3), None).collect::<Vec<_>>();
 
         assert_eq!(data.len(), 3);
 
         // Verify first row data
         let first_row = &data[0].0;
         let json_value = &first_row.0;
+        assert_eq!(row_keys(json_value), expected_columns);
         assert_eq!(json_value["id"], 1);
         assert_eq!(json_value["name"], "Alice");
         assert_eq!(json_value["age"], 25);
@@ -565,6 +964,44 @@ mod tests {
         let salary = json_value["salary"].as_f64().unwrap();
         assert!((salary - 50000.5).abs() < 0.1);
         assert_eq!(json_value["is_active"], true);
+        assert_eq!(json_value["hire_date"], "2020-01-15");
+        assert_eq!(json_value["created_at"], "2024-01-01 10:30:00");
+
+        // Test projected scan
+        let projection = vec!["id".to_string(), "name".to_string()];
+        let data: Vec<(pgrx::JsonB,)> =
+            crate::lance_scan_jsonb(table_path_str, Some(2), Some(projection)).collect::<Vec<_>>();
+
+        assert_eq!(data.len(), 2);
+        let json_value = &data[1].0 .0;
+        assert_eq!(row_keys(json_value), BTreeSet::from(["id", "name"]));
+        assert_eq!(json_value["id"], 2);
+        assert_eq!(json_value["name"], "Bob");
+    }
+
+    #[pg_test(error = "Column(s) not found in Lance table: nonexistent")]
+    fn test_scan_unknown_column() {
+        let generator =
+            LanceTestDataGenerator::new().expect("Failed to create test data generator");
+        let table_path = generator
+            .create_simple_table()
+            .expect("Failed to create simple table");
+
+        let columns = vec!["id".to_string(), "nonexistent".to_string()];
+        let _: Vec<(pgrx::JsonB,)> =
+            crate::lance_scan_jsonb(&table_path, None, Some(columns)).collect::<Vec<_>>();
+    }
+
+    #[pg_test(error = "columns must name at least one column")]
+    fn test_scan_empty_columns() {
+        let generator =
+            LanceTestDataGenerator::new().expect("Failed to create test data generator");
+        let table_path = generator
+            .create_simple_table()
+            .expect("Failed to create simple table");
+
+        let _: Vec<(pgrx::JsonB,)> =
+            crate::lance_scan_jsonb(&table_path, None, Some(Vec::new())).collect::<Vec<_>>();
     }
 
     #[pg_test]
@@ -574,30 +1011,38 @@ mod tests {
         let table_path = generator
             .create_vector_table()
             .expect("Failed to create vector table");
-        let table_path_str = table_path.to_str().unwrap();
+        let table_path_str = table_path.as_str();
 
         // Test table info
         let table_info: Vec<(String, String, bool)> =
             crate::lance_table_info(table_path_str).collect::<Vec<_>>();
 
-        assert_eq!(table_info.len(), 3);
+        let expected_columns = BTreeSet::from(["id", "document", "embedding", "metadata"]);
+        assert_eq!(info_column_names(&table_info), expected_columns);
 
-        // Check embedding column (should be a list type)
+        // Check embedding column (fixed-size float lists map to arrays)
         let embedding_column = table_info
             .iter()
             .find(|(name, _, _)| name == "embedding")
             .unwrap();
-        assert!(embedding_column.1.contains("json")); // Lists are converted to JSON in PostgreSQL
+        assert_eq!(embedding_column.1, "float4[]");
+
+        let metadata_column = table_info
+            .iter()
+            .find(|(name, _, _)| name == "metadata")
+            .unwrap();
+        assert_eq!(metadata_column.1, "jsonb"); // Structs are converted to JSON in PostgreSQL
 
         // Test data scanning with limit
         let data: Vec<(pgrx::JsonB,)> =
-            crate::lance_scan_jsonb(table_path_str, Some(2)).collect::<Vec<_>>();
+            crate::lance_scan_jsonb(table_path_str, Some(2), None).collect::<Vec<_>>();
 
         assert_eq!(data.len(), 2);
 
         // Verify first row has vector data
         let first_row = &data[0].0;
         let json_value = &first_row.0;
+        assert_eq!(row_keys(json_value), expected_columns);
         assert_eq!(json_value["id"], 1);
         assert_eq!(json_value["document"], "doc1");
 
@@ -610,6 +1055,147 @@ mod tests {
         let val1 = embedding[1].as_f64().unwrap();
         assert!((val0 - 0.1).abs() < 0.01);
         assert!((val1 - 0.2).abs() < 0.01);
+
+        // Check that metadata is an object keyed by struct field names
+        let metadata = json_value["metadata"].as_object().unwrap();
+        assert_eq!(metadata.len(), 2);
+        assert_eq!(metadata["category"], "A");
+        let score = metadata["score"].as_f64().unwrap();
+        assert!((score - 0.95).abs() < 1e-9);
+    }
+
+    #[pg_test]
+    fn test_nullable_table_integration() {
+        let generator =
+            LanceTestDataGenerator::new().expect("Failed to create test data generator");
+        let table_path = generator
+            .create_nullable_table()
+            .expect("Failed to create nullable table");
+
+        let data: Vec<(pgrx::JsonB,)> =
+            crate::lance_scan_jsonb(&table_path, None, None).collect::<Vec<_>>();
+
+        assert_eq!(data.len(), 4);
+
+        let expected_columns = BTreeSet::from(["id", "name", "embedding", "metadata"]);
+        for (row_idx, (row,)) in data.iter().enumerate() {
+            assert_eq!(row_keys(&row.0), expected_columns);
+            assert_eq!(row.0["id"], row_idx as i64 + 1);
+        }
+
+        // A null scalar is null only in its own row
+        assert_eq!(data[0].0 .0["name"], "a");
+        assert!(data[1].0 .0["name"].is_null());
+        assert_eq!(data[2].0 .0["name"], "c");
+
+        // A null list slot must not shift the values of later rows
+        assert_eq!(data[1].0 .0["embedding"], serde_json::json!([3.0, 4.0]));
+        assert!(data[2].0 .0["embedding"].is_null());
+        assert_eq!(data[3].0 .0["embedding"], serde_json::json!([7.0, 8.0]));
+
+        // A null struct is null as a whole, a null child only inside the object
+        assert_eq!(
+            data[0].0 .0["metadata"],
+            serde_json::json!({"category": "A", "score": 0.5})
+        );
+        assert!(data[1].0 .0["metadata"].is_null());
+        assert_eq!(
+            data[2].0 .0["metadata"],
+            serde_json::json!({"category": null, "score": 0.7})
+        );
+        assert_eq!(
+            data[3].0 .0["metadata"],
+            serde_json::json!({"category": "D", "score": 0.9})
+        );
+    }
+
+    #[pg_test]
+    fn test_large_table_integration() {
+        const LARGE_TABLE_BATCH_ROWS: usize = 256;
+
+        // Override with PGLANCE_LARGE_TABLE_ROWS to benchmark realistic table sizes
+        let large_table_rows = match std::env::var("PGLANCE_LARGE_TABLE_ROWS") {
+            Ok(rows) => rows
+                .parse::<usize>()
+                .ok()
+                .filter(|&rows| rows > 0)
+                .unwrap_or_else(|| {
+                    panic!(
+                        "PGLANCE_LARGE_TABLE_ROWS must be a positive integer, got {:?}",
+                        rows
+                    )
+                }),
+            Err(std::env::VarError::NotPresent) => 1000,
+            Err(error) => panic!("Invalid PGLANCE_LARGE_TABLE_ROWS: {}", error),
+        };
+
+        let generator =
+            LanceTestDataGenerator::new().expect("Failed to create test data generator");
+        let table_path = generator
+            .create_large_table(large_table_rows, LARGE_TABLE_BATCH_ROWS)
+            .expect("Failed to create large table");
+        let table_path_str = table_path.as_str();
+
+        // Scans read at least one record batch per fragment
+        let dataset = generator
+            .runtime
+            .block_on(Dataset::open(table_path_str))
+            .expect("Failed to open large table");
+        assert_eq!(
+            dataset.get_fragments().len(),
+            large_table_rows.div_ceil(LARGE_TABLE_BATCH_ROWS)
+        );
+
+        // Test table info
+        let table_info: Vec<(String, String, bool)> =
+            crate::lance_table_info(table_path_str).collect::<Vec<_>>();
+
+        let expected_columns = BTreeSet::from(["id", "value", "category", "flag"]);
+        assert_eq!(info_column_names(&table_info), expected_columns);
+
+        let category_column = table_info
+            .iter()
+            .find(|(name, _, _)| name == "category")
+            .unwrap();
+        assert_eq!(category_column.1, "text");
+
+        // Test table stats
+        let stats: Vec<(i64, i64, i32)> =
+            crate::lance_table_stats(table_path_str).collect::<Vec<_>>();
+
+        assert_eq!(stats.len(), 1);
+        assert_eq!(stats[0].1, large_table_rows as i64);
+        assert_eq!(stats[0].2, 4);
+
+        // Test limited scan ending inside the second read batch; Lance applies
+        // the limit itself, so this checks the batches it returns line up
+        let limit = large_table_rows.min(LARGE_TABLE_BATCH_ROWS + LARGE_TABLE_BATCH_ROWS / 2);
+        let data: Vec<(pgrx::JsonB,)> =
+            crate::lance_scan_jsonb(table_path_str, Some(limit as i64), None).collect::<Vec<_>>();
+
+        assert_eq!(data.len(), limit);
+        for (row_idx, (row,)) in data.iter().enumerate() {
+            assert_eq!(row.0["id"], row_idx as i64 + 1);
+        }
+
+        let last_index = limit - 1;
+        let last_row = &data[last_index].0 .0;
+        assert_eq!(row_keys(last_row), expected_columns);
+        assert_eq!(last_row["id"], limit as i64);
+        assert_eq!(last_row["category"], format!("cat_{}", last_index % 10));
+        assert_eq!(last_row["flag"], last_index % 2 == 0);
+        let value = last_row["value"].as_f64().unwrap();
+        assert!((value - last_index as f64 * 0.1).abs() < 1e-9);
+
+        // Test full scan
+        let data: Vec<(pgrx::JsonB,)> =
+            crate::lance_scan_jsonb(table_path_str, None, None).collect::<Vec<_>>();
+
+        assert_eq!(data.len(), large_table_rows);
+        assert_eq!(
+            data[large_table_rows - 1].0 .0["id"],
+            large_table_rows as i64
+        );
     }
 }
 
@@ -1,21 +1,61 @@
 use arrow::record_batch::RecordBatch;
+use futures::stream::{BoxStream, StreamExt};
 use lance::Dataset;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 use tokio::runtime::Runtime;
 
+/// Rows per record batch requested from Lance scans
+pub const DEFAULT_BATCH_SIZE: usize = 8192;
+
+/// Async runtime shared by every scanner in this backend
+static RUNTIME: OnceLock<Runtime> = OnceLock::new();
+
+/// Worker threads in the shared runtime
+const RUNTIME_WORKER_THREADS: usize = 2;
+
+/// Get the shared async runtime, creating it on first use
+///
+/// The runtime lives until the backend exits, so repeated calls skip its
+/// setup but its worker threads stay parked between calls. Every call blocks
+/// on the runtime anyway, so the pool is kept to a fixed small size rather
+/// than one thread per CPU in each backend. Runtime threads block every
+/// signal, so PostgreSQL's handlers only ever run on the backend's own thread.
+pub fn runtime() -> Result<&'static Runtime, pgrx::PgSqlErrorCode> {
+    if let Some(runtime) = RUNTIME.get() {
+        return Ok(runtime);
+    }
+    let runtime = tokio::runtime::Builder::new_multi_thread()
+        .worker_threads(RUNTIME_WORKER_THREADS)
+        .on_thread_start(block_all_signals)
+        .enable_all()
+        .build()
+        .map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)?;
+    Ok(RUNTIME.get_or_init(|| runtime))
+}
+
+/// Block all signals on the calling thread
+fn block_all_signals() {
+    // SAFETY: the signal set is initialized by sigfillset before it is read,
+    // and only the calling thread's mask is changed
+    unsafe {
+        let mut signals = std::mem::MaybeUninit::<libc::sigset_t>::uninit();
+        libc::sigfillset(signals.as_mut_ptr());
+        libc::pthread_sigmask(libc::SIG_BLOCK, signals.as_ptr(), std::ptr::null_mut());
+    }
+}
+
 /// Lance table scanner
 pub struct LanceScanner {
     dataset: Dataset,
-    runtime: Arc<Runtime>,
+    schema: Arc<arrow::datatypes::Schema>,
+    runtime: &'static Runtime,
     batch_size: usize,
 }
 
 impl LanceScanner {
     /// Create a new Lance scanner
     pub fn new(table_path: &str) -> Result<Self, pgrx::PgSqlErrorCode> {
-        // Create async runtime
-        let runtime =
-            Arc::new(Runtime::new().map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)?);
+        let runtime = runtime()?;
 
         // Open dataset in async runtime
         let dataset = runtime.block_on(async {
@@ -24,41 +64,33 @@ impl LanceScanner {
                 .map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)
         })?;
 
+        let schema = arrow_schema(&dataset);
+
         Ok(Self {
             dataset,
+            schema,
             runtime,
-            batch_size: 1024,
+            batch_size: DEFAULT_BATCH_SIZE,
         })
     }
 
     /// Get table schema
     pub fn schema(&self) -> Arc<arrow::datatypes::Schema> {
-        let lance_schema = self.dataset.schema();
-        let arrow_fields: Vec<Arc<arrow::datatypes::Field>> = lance_schema
-            .fields
-            .iter()
-            .map(|field| {
-                Arc::new(arrow::datatypes::Field::new(
-                    field.name.clone(),
-                    field.data_type().clone(),
-                    field.nullable,
-                ))
-            })
-            .collect();
-        Arc::new(arrow::datatypes::Schema::new(arrow_fields))
+        Arc::clone(&self.schema)
     }
 
-    /// Scan with filter conditions
+    /// Scan with filter conditions, optionally reading only `columns`
     pub fn scan_with_filter(
         &self,
         filter: Option<String>,
+        columns: Option<&[String]>,
         limit: Option<i64>,
     ) -> Result<LanceScanIterator, pgrx::PgSqlErrorCode> {
-        let runtime = Arc::clone(&self.runtime);
         let dataset = self.dataset.clone();
         let batch_size = self.batch_size;
+        let columns = columns.map(|columns| columns.to_vec());
 
-        let batches = runtime.block_on(async move {
+        let stream = self.runtime.block_on(async move {
             let mut scan = dataset.scan();
 
             scan.batch_size(batch_size);
@@ -68,29 +100,27 @@ impl LanceScanner {
                     .map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_SYNTAX_ERROR)?;
             }
 
+            if let Some(columns) = columns {
+                scan.project(columns.as_slice())
+                    .map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_UNDEFINED_COLUMN)?;
+            }
+
             if let Some(limit_val) = limit {
                 let _ = scan.limit(Some(limit_val), None);
             }
 
-            let stream = scan
-                .try_into_stream()
+            scan.try_into_stream()
                 .await
-                .map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)?;
-
-            let mut batches = Vec::new();
-            use futures::StreamExt;
-
-            let mut stream = Box::pin(stream);
-            while let Some(batch_result) = stream.next().await {
-                let batch =
-                    batch_result.map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)?;
-                batches.push(batch);
-            }
-
-            Ok::<Vec<RecordBatch>, pgrx::PgSqlErrorCode>(batches)
+                .map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)
         })?;
 
-        Ok(LanceScanIterator::new(batches))
+        let batches = stream
+            .map(|batch_result| {
+                batch_result.map_err(|_e| pgrx::PgSqlErrorCode::ERRCODE_INTERNAL_ERROR)
+            })
+            .boxed();
+
+        Ok(LanceScanIterator::new(batches, self.runtime))
     }
 
     /// Get table statistics
@@ -98,19 +128,7 @@ impl LanceScanner {
         let dataset = &self.dataset;
 
         let version = dataset.version().version;
-        let lance_schema = dataset.schema();
-        let arrow_fields: Vec<Arc<arrow::datatypes::Field>> = lance_schema
-            .fields
-            .iter()
-            .map(|field| {
-                Arc::new(arrow::datatypes::Field::new(
-                    field.name.clone(),
-                    field.data_type().clone(),
-                    field.nullable,
-                ))
-            })
-            .collect();
-        let schema = Arc::new(arrow::datatypes::Schema::new(arrow_fields));
+        let schema = self.schema();
 
         let num_rows = self.runtime.block_on(async {
             dataset
@@ -127,14 +145,46 @@ impl LanceScanner {
     }
 }
 
+/// Convert the Lance schema of a dataset into an Arrow schema
+fn arrow_schema(dataset: &Dataset) -> Arc<arrow::datatypes::Schema> {
+    let arrow_fields: Vec<Arc<arrow::datatypes::Field>> = dataset
+        .schema()
+        .fields
+        .iter()
+        .map(|field| {
+            Arc::new(arrow::datatypes::Field::new(
+                field.name.clone(),
+                field.data_type().clone(),
+                field.nullable,
+            ))
+        })
+        .collect();
+    Arc::new(arrow::datatypes::Schema::new(arrow_fields))
+}
+
 /// Lance scan iterator
+///
+/// Record batches are pulled from the underlying stream one at a time as the
+/// iterator advances, so a scan never holds more than the current batch.
 pub struct LanceScanIterator {
-    pub batches: Vec<RecordBatch>,
+    batches: BoxStream<'static, Result<RecordBatch, pgrx::PgSqlErrorCode>>,
+    runtime: &'static Runtime,
 }
 
 impl LanceScanIterator {
-    fn new(batches: Vec<RecordBatch>) -> Self {
-        Self { batches }
+    fn new(
+        batches: BoxStream<'static, Result<RecordBatch, pgrx::PgSqlErrorCode>>,
+        runtime: &'static Runtime,
+    ) -> Self {
+        Self { batches, runtime }
+    }
+}
+
+impl Iterator for LanceScanIterator {
+    type Item = Result<RecordBatch, pgrx::PgSqlErrorCode>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        self.runtime.block_on(self.batches.next())
     }
 }
 